@@ -0,0 +1,13 @@
+# Сравнение sync (lab5) и async (lab6) пути user_app под нагрузкой.
+# Запуск: ./benchmark.sh [BASE_URL], по умолчанию http://localhost:8000
+BASE_URL=${1:-http://localhost:8000}
+
+TOKEN=$(curl -s -X POST $BASE_URL/token \
+  -H "Content-Type: application/x-www-form-urlencoded" \
+  -d "username=admin&password=secret" | grep -o '"access_token":"[^"]*' | cut -d':' -f2 | tr -d '"')
+
+for CONNECTIONS in 10 50 200; do
+  echo "=== $CONNECTIONS connections ==="
+  wrk -t10 -c$CONNECTIONS -d30s --latency -H "Authorization: Bearer $TOKEN" $BASE_URL/users/admin
+  wrk -t10 -c$CONNECTIONS -d30s --latency -H "Authorization: Bearer $TOKEN" $BASE_URL/nocache/users/admin
+done
@@ -0,0 +1,36 @@
+# Латентность поиска по имени: прежний ILIKE (seq scan) против pg_trgm GIN + similarity.
+# Запуск при поднятом docker-compose: ./benchmark_search.sh [маска]
+MASK=${1:-ivan}
+PSQL="docker-compose exec -T database psql -U postgres -d services_db -q"
+
+$PSQL -c "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+for SIZE in 10000 1000000 10000000; do
+  echo "=== $SIZE users ==="
+  $PSQL <<SQL
+DELETE FROM users WHERE username LIKE 'bench_%';
+INSERT INTO users (username, full_name, email, hashed_password, is_specialist, disabled, created_at)
+SELECT 'bench_' || i,
+       (ARRAY['Ivan','Petr','Anna','Olga','Sergey','Maria','Dmitry','Elena'])[1 + i % 8] || ' ' ||
+       (ARRAY['Ivanov','Petrov','Smirnova','Kuznetsov','Popova','Sokolov','Lebedeva','Novikov'])[1 + (i / 8) % 8] || ' ' || md5(i::text),
+       'bench_' || i || '@example.com', 'x', i % 10 = 0, false, now()
+FROM generate_series(1, $SIZE) AS i;
+ANALYZE users;
+
+DROP INDEX IF EXISTS idx_users_full_name_trgm;
+\timing on
+\echo '--- ILIKE, без trgm-индекса (прежний путь, без лимита)'
+EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM users WHERE full_name ILIKE '%$MASK%';
+\timing off
+
+CREATE INDEX idx_users_full_name_trgm ON users USING gin (full_name gin_trgm_ops);
+\timing on
+\echo '--- pg_trgm, ранжирование по similarity, LIMIT 50'
+EXPLAIN (ANALYZE, BUFFERS) SELECT *, similarity(full_name, '$MASK') AS rank FROM users
+WHERE full_name ILIKE '%$MASK%' OR full_name % '$MASK'
+ORDER BY rank DESC, id LIMIT 51;
+\timing off
+SQL
+done
+
+$PSQL -c "DELETE FROM users WHERE username LIKE 'bench_%'"
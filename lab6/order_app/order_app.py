@@ -1,5 +1,6 @@
 import logging
 import os
+import asyncio
 from fastapi import FastAPI, Depends, HTTPException, status, Security
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
@@ -8,13 +9,14 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime
 from jose import jwt
 from fastapi.middleware.cors import CORSMiddleware
+from redis import asyncio as aioredis
+from async_logging import setup_logging
+from token_revocation import RevokedTokens
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(), logging.FileHandler("order_service.log")]
-)
+setup_logging("order_app", "order_service.log", sample_rates="order_app.auth=0.01")
 logger = logging.getLogger(__name__)
+# логгер горячего пути, пишется с выборкой (LOG_SAMPLE_RATES)
+auth_logger = logging.getLogger("order_app.auth")
 
 app = FastAPI(
     title="Order Service API", 
@@ -36,9 +38,21 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "secret_key")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 SERVICE_SERVICE_URL = os.getenv("SERVICE_SERVICE_URL", "http://localhost:8001")
 USER_SERVICE_URL = os.getenv("USER_SERVICE_URL", "http://localhost:8000")
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{USER_SERVICE_URL}/token")
 http_bearer = HTTPBearer()
+revocation_redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+
+revoked_tokens = RevokedTokens(revocation_redis)
+
+@app.on_event("startup")
+async def start_token_revocation_listener():
+    app.state.token_revocation_task = asyncio.create_task(revoked_tokens.listen())
+
+@app.on_event("shutdown")
+async def stop_token_revocation_listener():
+    app.state.token_revocation_task.cancel()
 
 class OrderItem(BaseModel):
     service_id: str
@@ -98,7 +112,19 @@ async def validate_token(token: str):
         username = payload.get("sub")
         if username is None:
             raise HTTPException(status_code=401, detail="Invalid token")
-        return {"username": username}
+        if not revoked_tokens.loaded:
+            raise HTTPException(status_code=503, detail="Token revocation list is not loaded yet")
+        if payload.get("jti") in revoked_tokens:
+            raise HTTPException(status_code=401, detail="Token revoked")
+        if payload.get("disabled"):
+            raise HTTPException(status_code=401, detail="User disabled")
+        return {
+            "username": username,
+            "id": payload.get("id"),
+            "is_specialist": payload.get("is_specialist", False),
+        }
+    except HTTPException:
+        raise
     except jwt.ExpiredSignatureError:
         logger.warning("Token expired")
         raise HTTPException(status_code=401, detail="Token expired")
@@ -110,11 +136,11 @@ async def validate_token(token: str):
         raise HTTPException(status_code=401, detail=f"Error validating token: {str(e)}")
 
 async def get_current_user_oauth(token: str = Depends(oauth2_scheme)):
-    logger.info(f"Validating OAuth token: {token[:10]}...")
+    auth_logger.info(f"Validating OAuth token: {token[:10]}...")
     return await validate_token(token)
 
 async def get_current_user_bearer(credentials: HTTPAuthorizationCredentials = Security(http_bearer)):
-    logger.info(f"Validating Bearer token: {credentials.credentials[:10]}...")
+    auth_logger.info(f"Validating Bearer token: {credentials.credentials[:10]}...")
     return await validate_token(credentials.credentials)
 
 async def get_current_user(
@@ -0,0 +1,4 @@
+#!/bin/bash
+# Разрешает потоковую репликацию для профиля replica (docker compose --profile replica up)
+set -e
+echo "host replication all all md5" >> "$PGDATA/pg_hba.conf"
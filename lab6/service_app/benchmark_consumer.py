@@ -0,0 +1,89 @@
+"""Пропускная способность service_consumer при разных размерах пачки.
+
+Запуск рядом с поднятыми Kafka и PostgreSQL:
+KAFKA_BOOTSTRAP_SERVERS=localhost:9092 DATABASE_URL=... python benchmark_consumer.py [--messages 20000] [--batch-sizes 1,10,100,500,1000]
+Сообщения один раз пишутся в отдельный топик, каждый прогон читает его новой группой консьюмеров.
+Учитывается только время вызовов consume_batch, вернувших сообщения, без вступления в группу.
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+
+from kafka import KafkaProducer
+from sqlalchemy import delete
+
+import service_consumer
+
+# id вне диапазона сервиса (uuid4 % 10**9), строки прогона удаляются после него
+BENCHMARK_ID_OFFSET = 10**9
+
+
+def produce(topic: str, count: int):
+    producer = KafkaProducer(
+        bootstrap_servers=service_consumer.KAFKA_BOOTSTRAP_SERVERS,
+        value_serializer=lambda v: json.dumps(v).encode('utf-8'),
+        linger_ms=20,
+    )
+    for i in range(count):
+        producer.send(topic, value={
+            "id": BENCHMARK_ID_OFFSET + i,
+            "title": f"Benchmark service {i}",
+            "description": "Consumer throughput benchmark",
+            "price": 100.0,
+            "specialist_id": 1,
+            "created_at": datetime.now().isoformat(),
+        })
+    producer.flush()
+    producer.close()
+
+
+def delete_benchmark_rows(db, count: int):
+    model = service_consumer.ServiceModel
+    db.execute(delete(model).where(model.id >= BENCHMARK_ID_OFFSET, model.id < BENCHMARK_ID_OFFSET + count))
+    db.commit()
+
+
+def run(topic: str, count: int, batch_size: int) -> float:
+    group_id = f"benchmark-{uuid.uuid4().hex[:8]}"
+    consumer = service_consumer.create_kafka_consumer(topic=topic, group_id=group_id, max_poll_records=batch_size)
+    db = service_consumer.SessionLocal()
+    consumed = 0
+    elapsed = 0.0
+    try:
+        # строки прерванного прогона превратили бы пачки в построчную запись
+        delete_benchmark_rows(db, count)
+        while consumed < count:
+            start_time = time.perf_counter()
+            received = service_consumer.consume_batch(consumer, db, batch_size)
+            if received:
+                elapsed += time.perf_counter() - start_time
+                consumed += received
+        delete_benchmark_rows(db, count)
+        offsets = service_consumer.ConsumerOffsetModel
+        db.execute(delete(offsets).where(offsets.group_id == group_id))
+        db.commit()
+    finally:
+        db.close()
+        consumer.close()
+    return consumed / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service consumer throughput benchmark")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--batch-sizes", default="1,10,100,500,1000")
+    args = parser.parse_args()
+
+    service_consumer.Base.metadata.create_all(bind=service_consumer.engine)
+    topic = f"service_created_benchmark_{uuid.uuid4().hex[:8]}"
+    produce(topic, args.messages)
+
+    print(f"{'batch size':>10}{'messages/s':>14}")
+    for batch_size in [int(size) for size in args.batch_sizes.split(",")]:
+        print(f"{batch_size:>10}{run(topic, args.messages, batch_size):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
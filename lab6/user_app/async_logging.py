@@ -0,0 +1,134 @@
+"""Асинхронное логирование: запись в очередь на горячем пути, форматирование и вывод в фоновом потоке.
+
+Копия модуля лежит в каждом сервисе (user_app, service_app, order_app) - контексты сборки раздельные.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+
+logging_stats = {"dropped": 0, "sampled_out": 0}
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """"user_app.cache=0.01,user_app.requests=0.1" -> {"user_app.cache": 0.01, ...}"""
+    rates = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, rate = item.split("=", 1)
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна запись - одна JSON-строка"""
+
+    def __init__(self, service: str):
+        super().__init__()
+        self.service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "service": self.service,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Вероятностная выборка INFO/DEBUG по логгерам; WARNING и выше проходят всегда"""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, float] = {}
+
+    def rate_for(self, name: str) -> float:
+        # самый длинный совпавший префикс: "user_app.cache" действует и на "user_app.cache.l1"
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            prefix = name
+            while prefix:
+                if prefix in self.rates:
+                    rate = self.rates[prefix]
+                    break
+                prefix = prefix.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate_for(record.name)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        logging_stats["sampled_out"] += 1
+        return False
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler без форматирования в вызывающем потоке и без блокировки при переполнении"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # очередь внутрипроцессная, поэтому достаточно зафиксировать текст сообщения
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            logging_stats["dropped"] += 1
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """При остановке ждёт место в очереди под маркер, чтобы дописать все записи"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+def setup_logging(service: str, log_file: Optional[str] = None,
+                  sample_rates: str = "") -> DrainingQueueListener:
+    """Настройка корневого логгера: очередь -> фоновый поток -> stdout и файл в JSON.
+    sample_rates по умолчанию переопределяется переменной LOG_SAMPLE_RATES
+    """
+    formatter = JsonFormatter(service)
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", sample_rates))))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    listener = DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # при остановке процесса дописываются записи, оставшиеся в очереди
+    atexit.register(listener.stop)
+    return listener
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    return {**logging_stats}
@@ -0,0 +1,84 @@
+"""Микробенчмарк кодеков кеша user_app.
+
+Запуск: python benchmark_codecs.py [--users 100000] [--redis-url redis://localhost:6379/0]
+С --redis-url дополнительно меряется прирост used_memory Redis на N закешированных пользователей.
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+
+import redis
+
+from cache_codec import CODECS, encode_cache_value, decode_cache_value
+
+
+def make_users(count: int) -> list:
+    created_at = datetime(2024, 1, 1).isoformat()
+    return [
+        {
+            "id": i,
+            "username": f"user{i}",
+            "full_name": f"Test User {i}",
+            "email": f"user{i}@example.com",
+            "is_specialist": i % 10 == 0,
+            "disabled": False,
+            "created_at": created_at,
+            "hashed_password": "$2b$12$" + "x" * 53,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(func, values) -> float:
+    start_time = time.perf_counter()
+    for value in values:
+        func(value)
+    return time.perf_counter() - start_time
+
+
+def measure_redis_memory(client, payloads) -> int:
+    client.flushdb()
+    before = client.info("memory")["used_memory"]
+    pipe = client.pipeline(transaction=False)
+    for i, payload in enumerate(payloads):
+        pipe.set(f"bench:user:{i}", payload)
+        if i % 1000 == 999:
+            pipe.execute()
+    pipe.execute()
+    used = client.info("memory")["used_memory"] - before
+    client.flushdb()
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache codec microbenchmark")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--redis-url", default=None, help="пустая БД Redis, будет очищена")
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+    client = redis.from_url(args.redis_url) if args.redis_url else None
+
+    print(f"{'codec':<16}{'encode, s':>12}{'decode, s':>12}{'payload, MB':>14}{'redis, MB':>12}")
+
+    # прежний формат: json.dumps на пользователя, списки - json.dumps списка JSON-строк
+    legacy = [json.dumps(user) for user in users]
+    legacy_list = json.dumps(legacy)
+    encode_time = measure(json.dumps, users) + measure(json.dumps, [legacy])
+    decode_time = measure(lambda value: [json.loads(item) for item in json.loads(value)], [legacy_list])
+    redis_mb = f"{measure_redis_memory(client, legacy) / 2**20:.2f}" if client else "-"
+    print(f"{'legacy json':<16}{encode_time:>12.3f}{decode_time:>12.3f}"
+          f"{sum(map(len, legacy)) / 2**20:>14.2f}{redis_mb:>12}")
+
+    for codec in CODECS:
+        payloads = [encode_cache_value(user, codec) for user in users]
+        encode_time = measure(lambda user: encode_cache_value(user, codec), users)
+        decode_time = measure(decode_cache_value, payloads)
+        redis_mb = f"{measure_redis_memory(client, payloads) / 2**20:.2f}" if client else "-"
+        print(f"{codec:<16}{encode_time:>12.3f}{decode_time:>12.3f}"
+              f"{sum(map(len, payloads)) / 2**20:>14.2f}{redis_mb:>12}")
+
+
+if __name__ == "__main__":
+    main()
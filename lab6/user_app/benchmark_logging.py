@@ -0,0 +1,73 @@
+"""Стоимость логирования в потоке event loop: прежний синхронный вывод против очереди с выборкой.
+
+Запуск: python benchmark_logging.py [--requests 20000] [--lines-per-request 4]
+Каждый "запрос" пишет lines_per_request строк в логгер горячего пути, как обработчик /users/{username}.
+"""
+import argparse
+import atexit
+import logging
+import os
+import tempfile
+import time
+
+import async_logging
+
+
+def configure_sync(log_file: str, stream):
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(stream), logging.FileHandler(log_file)],
+        force=True,
+    )
+
+
+def configure_queue(log_file: str, stream, sample_rates: str):
+    os.environ["LOG_SAMPLE_RATES"] = sample_rates
+    listener = async_logging.setup_logging("benchmark", log_file)
+    # вывод в /dev/null вместо stdout, чтобы терминал не влиял на замер
+    listener.handlers[0].setStream(stream)
+    return listener
+
+
+def run(requests: int, lines_per_request: int) -> float:
+    logger = logging.getLogger("user_app.cache")
+    start_time = time.perf_counter()
+    for i in range(requests):
+        for _ in range(lines_per_request):
+            logger.info(f"Cache HIT for user: user{i}")
+    return time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--lines-per-request", type=int, default=4)
+    args = parser.parse_args()
+
+    modes = [
+        ("sync", lambda path, stream: configure_sync(path, stream)),
+        ("queue", lambda path, stream: configure_queue(path, stream, "")),
+        ("queue + 1% sample", lambda path, stream: configure_queue(path, stream, "user_app.cache=0.01")),
+    ]
+
+    print(f"{'mode':<20}{'us/request':>12}{'max RPS':>12}{'drain, s':>10}{'dropped':>10}")
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        for name, configure in modes:
+            async_logging.logging_stats["dropped"] = 0
+            listener = configure(os.path.join(tmp, "bench.log"), devnull)
+            elapsed = run(args.requests, args.lines_per_request)
+            # дозапись очереди фоновым потоком уже не занимает event loop
+            start_time = time.perf_counter()
+            if listener:
+                listener.stop()
+                atexit.unregister(listener.stop)
+            drain = time.perf_counter() - start_time
+            per_request = elapsed / args.requests
+            # потолок RPS одного event loop, если бы он только логировал
+            print(f"{name:<20}{per_request * 1e6:>12.1f}{1 / per_request:>12.0f}"
+                  f"{drain:>10.2f}{async_logging.logging_stats['dropped']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Число round trip'ов в Redis на промах кеша и на регистрацию пользователя.
+
+Запуск рядом с поднятыми PostgreSQL и Redis:
+DATABASE_URL=... REDIS_URL=... python benchmark_roundtrips.py [--iterations 100]
+"""
+import argparse
+import asyncio
+import uuid
+
+from redis import asyncio as aioredis
+from sqlalchemy import delete
+
+import user_app
+
+
+class CountingConnection(aioredis.Connection):
+    """Соединение, считающее отправленные пакеты: один пакет - один round trip, pipeline - тоже один"""
+    round_trips = 0
+
+    async def send_packed_command(self, command, check_health=True):
+        CountingConnection.round_trips += 1
+        return await super().send_packed_command(command, check_health)
+
+
+async def measure(iterations: int):
+    user_app.redis_client = aioredis.from_url(user_app.REDIS_URL, connection_class=CountingConnection)
+    await user_app.load_cache_generations()
+    usernames = [f"rt_bench_{uuid.uuid4().hex[:12]}" for _ in range(iterations)]
+
+    async with user_app.SessionLocal() as db:
+        CountingConnection.round_trips = 0
+        for username in usernames:
+            user = user_app.UserCreate(
+                username=username, full_name="Round Trip Bench", email=f"{username}@example.com", password="x"
+            )
+            await user_app.create_db_user(db, user, hashed_password="x")
+        per_registration = CountingConnection.round_trips / iterations
+
+        # L1 и Redis-записи сбрасываются, чтобы каждый вызов был промахом
+        CountingConnection.round_trips = 0
+        misses = 0
+        for username in usernames:
+            user_app.local_cache.clear()
+            await user_app.redis_client.unlink(user_app.get_user_cache_key(username))
+            before = CountingConnection.round_trips
+            await user_app.get_user_by_username(db, username)
+            misses += CountingConnection.round_trips - before
+        per_miss = misses / iterations
+
+        await db.execute(delete(user_app.UserModel).where(user_app.UserModel.username.in_(usernames)))
+        await db.commit()
+
+    print(f"Redis round trips per registration: {per_registration:.1f}")
+    print(f"Redis round trips per cache miss:   {per_miss:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis round trips per operation")
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(measure(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
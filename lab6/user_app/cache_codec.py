@@ -0,0 +1,31 @@
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import msgpack
+import orjson
+
+# Заголовок значения в кеше: версия формата + id кодека.
+# Значения другой версии (в т.ч. старые JSON-записи без заголовка) считаются промахом.
+CACHE_FORMAT_VERSION = 1
+CACHE_CODEC = os.getenv("CACHE_CODEC", "msgpack")
+
+CODECS: Dict[str, Tuple[int, Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (1, lambda value: json.dumps(value).encode(), json.loads),
+    "orjson": (2, orjson.dumps, orjson.loads),
+    "msgpack": (3, msgpack.packb, lambda data: msgpack.unpackb(data, raw=False)),
+}
+CODECS_BY_ID = {codec_id: decode for codec_id, _, decode in CODECS.values()}
+
+
+def encode_cache_value(value: Any, codec: str = CACHE_CODEC) -> bytes:
+    """Кодирование значения для кеша с версионным заголовком"""
+    codec_id, encode, _ = CODECS[codec]
+    return bytes((CACHE_FORMAT_VERSION, codec_id)) + encode(value)
+
+
+def decode_cache_value(data: bytes) -> Optional[Any]:
+    """Декодирование значения из кеша по заголовку, None - если формат не поддерживается"""
+    if len(data) < 2 or data[0] != CACHE_FORMAT_VERSION or data[1] not in CODECS_BY_ID:
+        return None
+    return CODECS_BY_ID[data[1]](data[2:])
@@ -0,0 +1,67 @@
+"""Отзыв JWT: копия Redis-множества отозванных токенов в памяти, обновляется через pub/sub.
+
+Копия модуля лежит в каждом сервисе (user_app, service_app, order_app) - контексты сборки раздельные.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Dict
+
+REVOKED_TOKENS_KEY = "auth:revoked_tokens"
+TOKEN_REVOCATION_CHANNEL = "auth:token_revocations"
+
+logger = logging.getLogger(__name__)
+
+
+class RevokedTokens:
+    """jti отозванных токенов -> exp.
+    До первой загрузки множества из Redis loaded=False, и сервисы отклоняют токены с 503: иначе
+    отозванный токен принимался бы, пока Redis недоступен на старте. После загрузки разрыв с Redis
+    оставляет последнее известное множество до переподписки
+    """
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.tokens: Dict[str, float] = {}
+        self.loaded = False
+
+    def __contains__(self, jti) -> bool:
+        return jti in self.tokens
+
+    def prune(self):
+        now = time.time()
+        for jti in [jti for jti, expires_at in self.tokens.items() if expires_at < now]:
+            del self.tokens[jti]
+
+    async def revoke(self, jti: str, expires_at: float):
+        """Отзыв токена на всех сервисах"""
+        self.tokens[jti] = expires_at
+        await self.redis.zadd(REVOKED_TOKENS_KEY, {jti: expires_at})
+        await self.redis.zremrangebyscore(REVOKED_TOKENS_KEY, "-inf", time.time())
+        await self.redis.publish(TOKEN_REVOCATION_CHANNEL, json.dumps({"jti": jti, "exp": expires_at}))
+
+    async def listen(self):
+        """Фоновая синхронизация множества отозванных токенов"""
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(TOKEN_REVOCATION_CHANNEL)
+                # после (пере)подписки перечитываем множество целиком
+                revoked = await self.redis.zrangebyscore(REVOKED_TOKENS_KEY, time.time(), "+inf", withscores=True)
+                self.tokens = {
+                    jti.decode() if isinstance(jti, bytes) else jti: expires_at for jti, expires_at in revoked
+                }
+                self.loaded = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        revocation = json.loads(message["data"])
+                        self.prune()
+                        self.tokens[revocation["jti"]] = revocation["exp"]
+            except asyncio.CancelledError:
+                await pubsub.close()
+                raise
+            except Exception as e:
+                logger.error(f"Token revocation listener failed: {e}")
+                await pubsub.close()
+                await asyncio.sleep(1)